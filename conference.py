@@ -5,6 +5,7 @@ conference.py -- Conference server-side Python App Engine API;
     uses Google Cloud Endpoints
 
 """
+from datetime import date
 from datetime import datetime
 from datetime import time
 from google.appengine.api import taskqueue, urlfetch, memcache
@@ -13,17 +14,21 @@ from models import BooleanMessage, DateRange, IntegerRange, StringMessage, TimeR
 from models import Conference, ConferenceForm, ConferenceForms, ConferenceQueryForm, ConferenceQueryForms
 from models import ConflictException
 from models import Profile, ProfileMiniForm, ProfileForm
-from models import Session, SessionForm, SessionForms
+from models import Session, SessionForm, SessionForms, SessionSummaryForm, SessionSummaryForms
 from models import TeeShirtSize
 from protorpc import messages, message_types, remote
 from settings import WEB_CLIENT_ID
 import endpoints
+import threading
 import utils
 
 EMAIL_SCOPE = endpoints.EMAIL_SCOPE
 API_EXPLORER_CLIENT_ID = endpoints.API_EXPLORER_CLIENT_ID
 MEMCACHE_ANNOUNCEMENTS_KEY = "MEMCACHE KEY"
 
+# Number of results requested per datastore round trip by list queries.
+QUERY_BATCH_SIZE = 1000
+
 DEFAULTS = {
     "city": "Default City",
     "maxAttendees": 0,
@@ -40,6 +45,9 @@ OPERATORS = {
     'NE': '!='
 }
 
+# Every operator except "=" is an inequality
+INEQUALITY_OPERATORS = frozenset(('>', '>=', '<', '<=', '!='))
+
 FIELDS = {
     'CITY': 'city',
     'TOPIC': 'topics',
@@ -47,6 +55,16 @@ FIELDS = {
     'MAX_ATTENDEES': 'maxAttendees',
 }
 
+# Field names of the outbound forms along with how each one has to be converted.
+# Computed once, since the forms never change at runtime.
+PROFILE_FORM_FIELDS = tuple((field.name, field.name == 'teeShirtSize') for field in ProfileForm.all_fields())
+CONFERENCE_FORM_FIELDS = tuple((field.name, field.name.endswith('Date')) for field in ConferenceForm.all_fields())
+SESSION_FORM_FIELDS = tuple((field.name, field.name.endswith('Time') or field.name.endswith('date'))
+                            for field in SessionForm.all_fields())
+
+# Marks an attribute missing from an entity.
+_MISSING = object()
+
 CONF_GET_REQUEST = endpoints.ResourceContainer(
     # Empty request body.
     message_types.VoidMessage,
@@ -65,6 +83,77 @@ CONF_SESSIONS_TYPE_GET_REQUEST = endpoints.ResourceContainer(
 )
 
 
+# Websafe strings of the keys rendered by this instance; encoding a key is comparatively expensive.
+_WEBSAFE_KEYS = {}
+_WEBSAFE_KEYS_MAX_SIZE = 10000
+
+
+def _websafe_key(key):
+    """
+    Return key.urlsafe(), encoding each key only once per instance.
+    """
+    websafe_key = _WEBSAFE_KEYS.get(key)
+    if websafe_key is None:
+        if len(_WEBSAFE_KEYS) >= _WEBSAFE_KEYS_MAX_SIZE:
+            _WEBSAFE_KEYS.clear()
+        websafe_key = _WEBSAFE_KEYS[key] = key.urlsafe()
+    return websafe_key
+
+
+# Preallocated Session ids, keyed by conference key, so allocate_ids isn't called on every session create.
+# Conferences aren't pooled: their parent is the creator's profile, and a user rarely creates several
+# conferences in a row, so a per-user pool would almost never be reused.
+_SESSION_ID_POOL = {}
+_SESSION_ID_POOL_SIZE = 32
+_SESSION_ID_POOL_MAX_CONFERENCES = 1000
+_SESSION_ID_POOL_LOCK = threading.Lock()
+
+
+def _allocate_session_id(conference_key):
+    """
+    Return a new id for a Session under conference_key, taken from the pool.
+    """
+    with _SESSION_ID_POOL_LOCK:
+        ids = _SESSION_ID_POOL.get(conference_key)
+        if ids:
+            return ids.pop()
+
+    # Refill outside the lock, so other creates don't wait on this RPC.
+    first, last = Session.allocate_ids(size=_SESSION_ID_POOL_SIZE, parent=conference_key)
+    ids = range(last, first - 1, -1)
+    session_id = ids.pop()
+
+    with _SESSION_ID_POOL_LOCK:
+        if len(_SESSION_ID_POOL) >= _SESSION_ID_POOL_MAX_CONFERENCES:
+            _SESSION_ID_POOL.clear()
+        _SESSION_ID_POOL.setdefault(conference_key, []).extend(ids)
+
+    return session_id
+
+
+def _parse_date(value):
+    """
+    Parse a "YYYY-MM-DD" string (anything after the first 10 characters is ignored) into a date.
+    Splitting by hand is much cheaper than going through datetime.strptime.
+    """
+    try:
+        year, month, day = value[:10].split('-')
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        raise endpoints.BadRequestException('Invalid date: "%s". Expected format is YYYY-MM-DD.' % value)
+
+
+def _parse_time(value):
+    """
+    Parse a "HH:MM" string into a time.
+    """
+    try:
+        hour, minute = value.split(':')
+        return time(int(hour), int(minute))
+    except ValueError:
+        raise endpoints.BadRequestException('Invalid time: "%s". Expected format is HH:MM.' % value)
+
+
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
 @endpoints.api(name='conference', version='v1', allowed_client_ids=[WEB_CLIENT_ID, API_EXPLORER_CLIENT_ID],
@@ -84,13 +173,14 @@ class ConferenceApi(remote.Service):
         """
 
         profile_form = ProfileForm()
-        for field in profile_form.all_fields():
-            if hasattr(profile, field.name):
+        for name, is_tee_shirt_size in PROFILE_FORM_FIELDS:
+            value = getattr(profile, name, _MISSING)
+            if value is not _MISSING:
                 # convert t-shirt string to Enum; just copy others
-                if field.name == 'teeShirtSize':
-                    setattr(profile_form, field.name, getattr(TeeShirtSize, getattr(profile, field.name)))
+                if is_tee_shirt_size:
+                    setattr(profile_form, name, getattr(TeeShirtSize, value))
                 else:
-                    setattr(profile_form, field.name, getattr(profile, field.name))
+                    setattr(profile_form, name, value)
         profile_form.check_initialized()
         return profile_form
 
@@ -98,6 +188,13 @@ class ConferenceApi(remote.Service):
         """
         Return user Profile from datastore, creating new one if non-existent.
         """
+        return self._get_profile_async().get_result()
+
+    @ndb.tasklet
+    def _get_profile_async(self):
+        """
+        Return a future for the user Profile, creating new one if non-existent.
+        """
 
         user = endpoints.get_current_user()
 
@@ -107,7 +204,7 @@ class ConferenceApi(remote.Service):
         user_id = utils.get_user_id(user)  # We obtain the user id.
         profile_key = ndb.Key(Profile, user_id)  # Then we proceed to generate the key using the user id.
 
-        profile = profile_key.get()  # We look for this profile.
+        profile = yield profile_key.get_async()  # We look for this profile.
 
         if not profile:
             profile = Profile(
@@ -117,9 +214,9 @@ class ConferenceApi(remote.Service):
                 teeShirtSize=str(TeeShirtSize.NOT_SPECIFIED),
             )
 
-            profile.put()  # This saves the profile in datastore.
+            yield profile.put_async()  # This saves the profile in datastore.
 
-        return profile
+        raise ndb.Return(profile)
 
     def _do_profile(self, save_request=None):
         """
@@ -130,6 +227,8 @@ class ConferenceApi(remote.Service):
 
         # if saveProfile(), process user-modifiable fields
         if save_request:
+            old_display_name = profile.displayName
+
             for field in ('displayName', 'teeShirtSize'):
                 if hasattr(save_request, field):
                     val = getattr(save_request, field)
@@ -138,9 +237,25 @@ class ConferenceApi(remote.Service):
 
             profile.put()  # Save the modified profile.
 
+            # Keep the organizer's name stored in the user's conferences up to date.
+            if profile.displayName != old_display_name:
+                for conference_key in Conference.query(ancestor=profile.key).fetch(keys_only=True):
+                    self._set_organizer_display_name(conference_key, profile.displayName)
+
         # return ProfileForm
         return self._copy_profile_to_form(profile)
 
+    @ndb.transactional()
+    def _set_organizer_display_name(self, conference_key, display_name):
+        """
+        Update the organizer's name stored in a conference.
+        Done in its own transaction, so concurrent changes to the conference (e.g. seats) aren't lost.
+        """
+        conference = conference_key.get()
+        if conference and conference.organizerDisplayName != display_name:
+            conference.organizerDisplayName = display_name
+            conference.put()
+
     @endpoints.method(message_types.VoidMessage, ProfileForm, path='profile', http_method='GET', name='getProfile')
     def get_profile(self, request):
         """
@@ -164,15 +279,16 @@ class ConferenceApi(remote.Service):
         """
         conference_form = ConferenceForm()
 
-        for field in conference_form.all_fields():
-            if hasattr(conference, field.name):
+        for name, is_date in CONFERENCE_FORM_FIELDS:
+            value = getattr(conference, name, _MISSING)
+            if value is not _MISSING:
                 # convert Date to date string; just copy others
-                if field.name.endswith('Date'):
-                    setattr(conference_form, field.name, str(getattr(conference, field.name)))
+                if is_date:
+                    setattr(conference_form, name, str(value))
                 else:
-                    setattr(conference_form, field.name, getattr(conference, field.name))
-            elif field.name == "websafeKey":
-                setattr(conference_form, field.name, conference.key.urlsafe())
+                    setattr(conference_form, name, value)
+            elif name == "websafeKey":
+                setattr(conference_form, name, _websafe_key(conference.key))
 
         if display_name:
             setattr(conference_form, 'organizerDisplayName', display_name)
@@ -181,6 +297,23 @@ class ConferenceApi(remote.Service):
 
         return conference_form
 
+    def _get_organizers_display_names(self, conferences):
+        """
+        Return the organizer's display name of each conference, keyed by conference key.
+        Conferences stored before organizerDisplayName existed fall back to the organizer's profile.
+        """
+        display_names = {conf.key: conf.organizerDisplayName for conf in conferences if conf.organizerDisplayName}
+
+        # Get all the missing organizers' profiles at once, instead of one by one
+        missing_keys = [conf.key for conf in conferences if conf.key not in display_names]
+        if missing_keys:
+            organizers_keys = list({key.parent() for key in missing_keys})
+            organizers = dict(zip(organizers_keys, ndb.get_multi(organizers_keys)))
+            for key in missing_keys:
+                display_names[key] = getattr(organizers[key.parent()], 'displayName', "")
+
+        return display_names
+
     def _create_conference_object(self, request):
         """
         Create or update Conference object, returning ConferenceForm/request.
@@ -196,11 +329,13 @@ class ConferenceApi(remote.Service):
             raise endpoints.BadRequestException("Conference 'name' field required")
 
         user_id = utils.get_user_id(user)
+        # Make Profile Key from user ID and start fetching the organizer's profile right away
+        profile_key = ndb.Key(Profile, user_id)
+        profile_future = profile_key.get_async()
 
         # Copy ConferenceForm/ProtoRPC Message into dict
         data = {field.name: getattr(request, field.name) for field in request.all_fields()}
         del data['websafeKey']
-        del data['organizerDisplayName']
 
         # Add default values for those missing (both data model & outbound Message)
         for df in DEFAULTS:
@@ -210,13 +345,13 @@ class ConferenceApi(remote.Service):
 
         # Convert dates from strings to Date objects; set month based on start_date
         if data['startDate']:
-            data['startDate'] = datetime.strptime(data['startDate'][:10], "%Y-%m-%d").date()
+            data['startDate'] = _parse_date(data['startDate'])
             data['month'] = data['startDate'].month
         else:
             data['month'] = 0
 
         if data['endDate']:
-            data['endDate'] = datetime.strptime(data['endDate'][:10], "%Y-%m-%d").date()
+            data['endDate'] = _parse_date(data['endDate'])
 
         # Set seatsAvailable to be same as maxAttendees on creation
         # Both for data model & outbound Message
@@ -224,19 +359,22 @@ class ConferenceApi(remote.Service):
             data["seatsAvailable"] = data["maxAttendees"]
             setattr(request, "seatsAvailable", data["maxAttendees"])
 
-        # Make Profile Key from user ID
-        profile_key = ndb.Key(Profile, user_id)
         # Allocate new Conference ID with Profile key as parent/ancestor
         conference_id = Conference.allocate_ids(size=1, parent=profile_key)[0]
         # Make Conference key from ID
         conference_key = ndb.Key(Conference, conference_id, parent=profile_key)
         data['key'] = conference_key
         data['organizerUserId'] = request.organizerUserId = user_id
+        # Store the organizer's name along with the conference, so reading it doesn't need the profile.
+        # Users without a profile yet get the same name their profile would be created with.
+        profile = profile_future.get_result()
+        display_name = profile.displayName if profile else user.nickname()
+        data['organizerDisplayName'] = request.organizerDisplayName = display_name
 
         # Create Conference & return (modified) ConferenceForm
         Conference(**data).put()
         taskqueue.add(params={'email': user.email(),
-                              'conferenceInfo': repr(request)
+                              'conferenceKey': conference_key.urlsafe()
                               },
                       url='/tasks/send_confirmation_email'
                       )
@@ -279,25 +417,22 @@ class ConferenceApi(remote.Service):
         inequality_field = None
 
         for f in filters:
-            filters = {field.name: getattr(f, field.name) for field in f.all_fields()}
-
             try:
-                filters["field"] = FIELDS[filters["field"]]
-                filters["operator"] = OPERATORS[filters["operator"]]
+                field = FIELDS[f.field]
+                operator = OPERATORS[f.operator]
             except KeyError:
                 raise endpoints.BadRequestException("Filter contains invalid field or operator.")
 
-            # Every operation except "=" is an inequality
-            if filters["operator"] != "=":
+            if operator in INEQUALITY_OPERATORS:
                 # Check if inequality operation has been used in previous filters
                 # Disallow the filter if inequality was performed on a different field before
                 # Track the field on which the inequality operation is performed
-                if inequality_field and inequality_field != filters["field"]:
+                if inequality_field and inequality_field != field:
                     raise endpoints.BadRequestException("Inequality filter is allowed on only one field.")
                 else:
-                    inequality_field = filters["field"]
+                    inequality_field = field
 
-            formatted_filters.append(filters)
+            formatted_filters.append({'field': field, 'operator': operator, 'value': f.value})
         return inequality_field, formatted_filters
 
     @endpoints.method(ConferenceQueryForms, ConferenceForms, path='queryConferences', http_method='POST',
@@ -306,11 +441,13 @@ class ConferenceApi(remote.Service):
         """
         Query for conferences.
         """
-        conferences = self._get_query(request)
+        conferences = self._get_query(request).fetch(batch_size=QUERY_BATCH_SIZE)
+
+        display_names = self._get_organizers_display_names(conferences)
 
         # Return individual ConferenceForm object per Conference
         return ConferenceForms(
-            items=[self._copy_conference_to_form(conf, "") for conf in conferences]
+            items=[self._copy_conference_to_form(conf, display_names[conf.key]) for conf in conferences]
         )
 
     @endpoints.method(message_types.VoidMessage, ConferenceForms, path='getConferencesCreated', http_method='POST',
@@ -326,10 +463,12 @@ class ConferenceApi(remote.Service):
 
         # Make profile key
         profile_key = ndb.Key(Profile, utils.get_user_id(user))
-        # Create ancestor query for this user
-        conferences = Conference.query(ancestor=profile_key)
+        # Fetch the user profile and run the ancestor query for this user concurrently
+        prof_future = profile_key.get_async()
+        conferences_future = Conference.query(ancestor=profile_key).fetch_async()
         # Get the user profile and display name
-        prof = profile_key.get()
+        prof = prof_future.get_result()
+        conferences = conferences_future.get_result()
         display_name = getattr(prof, 'displayName')
         # Return set of ConferenceForm objects per Conference
         return ConferenceForms(
@@ -348,10 +487,10 @@ class ConferenceApi(remote.Service):
         if not conference:
             raise endpoints.NotFoundException('No conference found with key: %s' % request.websafeConferenceKey)
 
-        profile = conference.key.parent().get()
+        display_names = self._get_organizers_display_names([conference])
 
         # Return ConferenceForm
-        return self._copy_conference_to_form(conference, getattr(profile, 'displayName'))
+        return self._copy_conference_to_form(conference, display_names[conference.key])
 
     # ----------------------------------------------------------
     # - - - Sessions - - - - - - - - - - - - - - - - - - - - - -
@@ -374,7 +513,7 @@ class ConferenceApi(remote.Service):
         del data['sessionWebsafeKey']
 
         conference = ndb.Key(urlsafe=request.conferenceWebsafeKey).get()
-        session_id = Session.allocate_ids(size=1, parent=conference.key)[0]
+        session_id = _allocate_session_id(conference.key)
         session_key = ndb.Key(Session, session_id, parent=conference.key)
         # Get conference
 
@@ -385,13 +524,13 @@ class ConferenceApi(remote.Service):
             data['date'] = conference.startDate
             setattr(request, 'date', datetime.strftime(data['date'], "%Y-%m-%d"))
         else:
-            data['date'] = datetime.strptime(data['date'][:10], "%Y-%m-%d").date()
+            data['date'] = _parse_date(data['date'])
 
         if not data['startTime']:
             data['startTime'] = datetime.now().time()
             setattr(request, 'startTime', time.strftime(data['startTime'], "%H:%M"))
         else:
-            data['startTime'] = datetime.strptime(data['startTime'], "%H:%M").time()
+            data['startTime'] = _parse_time(data['startTime'])
 
         if not data['duration']:
             data['duration'] = 60
@@ -415,15 +554,16 @@ class ConferenceApi(remote.Service):
     def _copy_session_to_form(self, session):
         session_form = SessionForm()
 
-        for field in session_form.all_fields():
-            if hasattr(session, field.name):
+        for name, is_date_or_time in SESSION_FORM_FIELDS:
+            value = getattr(session, name, _MISSING)
+            if value is not _MISSING:
                 # convert Time to time string; just copy others
-                if field.name.endswith('Time') or field.name.endswith("date"):
-                    setattr(session_form, field.name, str(getattr(session, field.name)))
+                if is_date_or_time:
+                    setattr(session_form, name, str(value))
                 else:
-                    setattr(session_form, field.name, getattr(session, field.name))
+                    setattr(session_form, name, value)
 
-        setattr(session_form, "sessionWebsafeKey", session.key.urlsafe())
+        setattr(session_form, "sessionWebsafeKey", _websafe_key(session.key))
 
         session_form.check_initialized()
 
@@ -442,12 +582,32 @@ class ConferenceApi(remote.Service):
         conference_key = ndb.Key(urlsafe=request.websafeConferenceKey)
 
         # Look fot all the sessions that belongs to this conference.
-        sessions = Session.query(ancestor=conference_key)
+        sessions = Session.query(ancestor=conference_key).fetch(batch_size=QUERY_BATCH_SIZE)
 
         return SessionForms(
             items=[self._copy_session_to_form(s) for s in sessions]
         )
 
+    @endpoints.method(CONF_GET_REQUEST, SessionSummaryForms, path='conference/{websafeConferenceKey}/sessionSummaries',
+                      http_method='GET', name='getConferenceSessionSummaries')
+    def get_conference_session_summaries(self, request):
+        """
+        Return name, speaker and schedule of every session in the conference.
+        """
+        conference_key = ndb.Key(urlsafe=request.websafeConferenceKey)
+
+        # Only the summary fields are read from the index; the rest of each session is never fetched.
+        sessions = Session.query(ancestor=conference_key).fetch(
+            projection=[Session.name, Session.speaker, Session.date, Session.startTime])
+
+        return SessionSummaryForms(
+            items=[SessionSummaryForm(name=s.name,
+                                      speaker=s.speaker,
+                                      date=str(s.date),
+                                      startTime=str(s.startTime),
+                                      sessionWebsafeKey=_websafe_key(s.key)) for s in sessions]
+        )
+
     @endpoints.method(CONF_SESSIONS_TYPE_GET_REQUEST, SessionForms, path='sessionsByType/{websafeConferenceKey}',
                       http_method='POST', name='getConferenceSessionsByType')
     def get_conference_sessions_by_type(self, request):
@@ -461,7 +621,7 @@ class ConferenceApi(remote.Service):
         # query = query.filter(ndb.query.FilterNode("typeOfSession", "=", request.typeOfSession))
 
         return SessionForms(
-            items=[self._copy_session_to_form(s) for s in query]
+            items=[self._copy_session_to_form(s) for s in query.fetch(batch_size=QUERY_BATCH_SIZE)]
         )
 
     @endpoints.method(StringMessage, SessionForms, path='sessionsBySpeaker', http_method='POST',
@@ -470,7 +630,7 @@ class ConferenceApi(remote.Service):
         query = Session.query(Session.speaker == request.data)
 
         return SessionForms(
-            items=[self._copy_session_to_form(s) for s in query]
+            items=[self._copy_session_to_form(s) for s in query.fetch(batch_size=QUERY_BATCH_SIZE)]
         )
 
     @endpoints.method(IntegerRange, SessionForms, path='sessionsByDuration', http_method='POST',
@@ -499,7 +659,7 @@ class ConferenceApi(remote.Service):
         query = query.order(Session.duration)
 
         return SessionForms(
-            items=[self._copy_session_to_form(s) for s in query]
+            items=[self._copy_session_to_form(s) for s in query.fetch(batch_size=QUERY_BATCH_SIZE)]
         )
 
     @endpoints.method(DateRange, SessionForms, path='sessionsByDate', http_method='POST',
@@ -512,13 +672,13 @@ class ConferenceApi(remote.Service):
         max_date = None
 
         if request.min:
-            min_date = datetime.strptime(request.min[:10], "%Y-%m-%d").date()
+            min_date = _parse_date(request.min)
 
             # We are sure request.min is present and is valid.
             query = query.filter(Session.date >= min_date)
 
         if request.max:
-            max_date = datetime.strptime(request.max[:10], "%Y-%m-%d").date()
+            max_date = _parse_date(request.max)
 
             # We are sure request.max is present and is valid.
             query = query.filter(Session.date <= max_date)
@@ -529,7 +689,7 @@ class ConferenceApi(remote.Service):
         query = query.order(Session.date)
 
         return SessionForms(
-            items=[self._copy_session_to_form(s) for s in query]
+            items=[self._copy_session_to_form(s) for s in query.fetch(batch_size=QUERY_BATCH_SIZE)]
         )
 
     @endpoints.method(TimeRange, SessionForms, path='sessionsByStartTime', http_method='POST',
@@ -542,13 +702,13 @@ class ConferenceApi(remote.Service):
         max_time = None
 
         if request.min:
-            min_time = datetime.strptime(request.min, "%H:%M").time()
+            min_time = _parse_time(request.min)
 
             # We are sure request.min is present and is valid.
             query = query.filter(Session.startTime >= min_time)
 
         if request.max:
-            max_time = datetime.strptime(request.max, "%H:%M").time()
+            max_time = _parse_time(request.max)
 
             # We are sure request.max is present and is valid.
             query = query.filter(Session.startTime <= max_time)
@@ -559,7 +719,7 @@ class ConferenceApi(remote.Service):
         query = query.order(Session.startTime)
 
         return SessionForms(
-            items=[self._copy_session_to_form(s) for s in query]
+            items=[self._copy_session_to_form(s) for s in query.fetch(batch_size=QUERY_BATCH_SIZE)]
         )
 
     # ----------------------------------------------------------
@@ -570,10 +730,13 @@ class ConferenceApi(remote.Service):
                name='addSessionToWishlist')
     def add_session_to_wishlist(self, request):
 
-        profile = self._get_profile_from_user()  # get user Profile
-
         session_key = request.websafeSessionKey
-        session = ndb.Key(urlsafe=session_key).get()
+
+        # Get the user Profile and the session at the same time
+        profile_future = self._get_profile_async()
+        session_future = ndb.Key(urlsafe=session_key).get_async()
+        profile = profile_future.get_result()
+        session = session_future.get_result()
 
         if not session:
             raise endpoints.NotFoundException('No session found with key: %s' % session_key)
@@ -603,10 +766,13 @@ class ConferenceApi(remote.Service):
                name='deleteSessionInWishlist')
     def delete_session_in_wishlist(self, request):
 
-        profile = self._get_profile_from_user()  # get user Profile
-
         session_key = request.websafeSessionKey
-        session = ndb.Key(urlsafe=session_key).get()
+
+        # Get the user Profile and the session at the same time
+        profile_future = self._get_profile_async()
+        session_future = ndb.Key(urlsafe=session_key).get_async()
+        profile = profile_future.get_result()
+        session = session_future.get_result()
 
         if not session:
             raise endpoints.NotFoundException('No session found with key: %s' % session_key)
@@ -664,9 +830,8 @@ class ConferenceApi(remote.Service):
             else:
                 return_value = False
 
-        # Write things back to the datastore & return
-        profile.put()
-        conference.put()
+        # Write things back to the datastore in a single batch & return
+        ndb.put_multi([profile, conference])
         return BooleanMessage(data=return_value)
 
     @endpoints.method(CONF_GET_REQUEST, BooleanMessage, path='conference/{websafeConferenceKey}', http_method='POST',
@@ -699,8 +864,12 @@ class ConferenceApi(remote.Service):
         # Do not fetch them one by one!
         conferences = ndb.get_multi(conferences_keys)
 
+        display_names = self._get_organizers_display_names(conferences)
+
         # Return set of ConferenceForm objects per Conference
-        return ConferenceForms(items=[self._copy_conference_to_form(conf, "") for conf in conferences])
+        return ConferenceForms(
+            items=[self._copy_conference_to_form(conf, display_names[conf.key]) for conf in conferences]
+        )
 
     # - - - Announcements - - - - - - - - - - - - - - - - - - - -
 
@@ -737,7 +906,7 @@ class ConferenceApi(remote.Service):
         """
 
         # return an existing announcement from Memcache or an empty string.
-        announcement = ""
+        announcement = memcache.get(MEMCACHE_ANNOUNCEMENTS_KEY) or ""
         return StringMessage(data=announcement)
 
 
@@ -3,6 +3,7 @@
 from conference import ConferenceApi
 from google.appengine.api import app_identity
 from google.appengine.api import mail
+from google.appengine.ext import ndb
 import webapp2
 
 
@@ -20,14 +21,35 @@ class SendConfirmationEmailHandler(webapp2.RequestHandler):
         """
         Send email confirming Conference creation.
         """
+        websafe_conference_key = self.request.get('conferenceKey')
+
+        if websafe_conference_key:
+            conference = ndb.Key(urlsafe=websafe_conference_key).get()
+            if not conference:
+                return
+
+            conference_info = '\r\n'.join((
+                'Name: %s' % conference.name,
+                'Description: %s' % (conference.description or ''),
+                'Topics: %s' % ', '.join(conference.topics),
+                'City: %s' % conference.city,
+                'Start date: %s' % (conference.startDate or ''),
+                'End date: %s' % (conference.endDate or ''),
+                'Max attendees: %s' % conference.maxAttendees,
+            ))
+        else:
+            # Tasks enqueued before the conference key was sent carry the formatted conference instead.
+            conference_info = self.request.get('conferenceInfo')
+            if not conference_info:
+                return
+
         mail.send_mail(
             'noreply@%s.appspotmail.com' % (
                 app_identity.get_application_id()),     # from
             self.request.get('email'),                  # to
             'You created a new Conference!',            # subject
             'Hi, you have created a following '         # body
-            'conference:\r\n\r\n%s' % self.request.get(
-                'conferenceInfo')
+            'conference:\r\n\r\n%s' % conference_info
         )
 
 
@@ -54,9 +54,13 @@ class Conference(ndb.Model):
     """
     Conference -- Conference object
     """
+    # Skip NDB's memcache layer; it's only overhead for this kind. The in-context cache is still used.
+    _use_memcache = False
+
     name = ndb.StringProperty(required=True)
     description = ndb.StringProperty()
     organizerUserId = ndb.StringProperty()
+    organizerDisplayName = ndb.StringProperty()
     topics = ndb.StringProperty(repeated=True)
     city = ndb.StringProperty()
     startDate = ndb.DateProperty()
@@ -111,6 +115,9 @@ class Session(ndb.Model):
     """
     Session --
     """
+    # Skip NDB's memcache layer; it's only overhead for this kind. The in-context cache is still used.
+    _use_memcache = False
+
     name = ndb.StringProperty(required=True)
     highlights = ndb.StringProperty()
     speaker = ndb.StringProperty(required=True)  # TODO Check this... It might be an entity
@@ -144,6 +151,24 @@ class SessionForms(messages.Message):
     items = messages.MessageField(SessionForm, 1, repeated=True)
 
 
+class SessionSummaryForm(messages.Message):
+    """
+    SessionSummaryForm -- lightweight Session outbound form message.
+    """
+    name = messages.StringField(1)
+    speaker = messages.StringField(2)
+    date = messages.StringField(3)
+    startTime = messages.StringField(4)
+    sessionWebsafeKey = messages.StringField(5)
+
+
+class SessionSummaryForms(messages.Message):
+    """
+    SessionSummaryForms - Multiple SessionSummaryForm outbound form message.
+    """
+    items = messages.MessageField(SessionSummaryForm, 1, repeated=True)
+
+
 class BooleanMessage(messages.Message):
     """
     BooleanMessage-- outbound Boolean value message